@@ -1,8 +1,228 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numpy scan is used instead
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; histories are then only cached in memory
+    pa = pq = None
+
+
+def _wave_2_ends(low_ts, high_ts):
+    """
+    Return the lows j that can end wave 2, with the number of earlier lows
+    that can start wave 1 for each. Both arrays are non-decreasing.
+    """
+    # Wave 1 peaks at high j-1, wave 2 bottoms at low j and wave 3 peaks at high j
+    j = np.arange(1, min(len(low_ts), len(high_ts)))
+    j = j[high_ts[j - 1] < low_ts[j]]
+
+    # Every earlier low preceding the wave 1 peak is a candidate wave 1 start
+    counts = np.minimum(np.searchsorted(low_ts, high_ts[j - 1], side='left'), j)
+    return j, counts
+
+
+def _in_fibonacci_band(low_vals, high_vals, i, j):
+    """Return the wave 2 retracements for wave 1 starts `i` and wave 2 end `j`, and which lie in the band."""
+    wave_1_length = high_vals[j - 1] - low_vals[i]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        wave_2_retracement = np.abs((low_vals[j] - high_vals[j - 1]) / wave_1_length)
+    return wave_2_retracement, (wave_2_retracement >= 0.5) & (wave_2_retracement <= 0.618)
+
+
+def _scan_waves_numpy(low_vals, low_ts, high_vals, high_ts):
+    """
+    Pair swing lows and highs into wave 1-3 candidates.
+
+    Returns the (low index, high index, wave 2 retracement) arrays of the
+    candidates inside the Fibonacci band, in (i, j) scan order. Each wave 2
+    end is scanned against its wave 1 starts in turn, so memory stays
+    proportional to the swings plus the accepted candidates.
+    """
+    i_parts = [np.empty(0, dtype=np.int64)]
+    j_parts = [np.empty(0, dtype=np.int64)]
+    retrace_parts = [np.empty(0, dtype=np.float64)]
+    for j, count in zip(*(a.tolist() for a in _wave_2_ends(low_ts, high_ts))):
+        i = np.arange(count, dtype=np.int64)
+        wave_2_retracement, valid = _in_fibonacci_band(low_vals, high_vals, i, j)
+        i_parts.append(i[valid])
+        j_parts.append(np.full(len(i_parts[-1]), j, dtype=np.int64))
+        retrace_parts.append(wave_2_retracement[valid])
+
+    i, j, wave_2_retracement = (np.concatenate(parts) for parts in (i_parts, j_parts, retrace_parts))
+    order = np.lexsort((j, i))
+    return i[order], j[order], wave_2_retracement[order]
+
+
+def _find_last_wave_numpy(low_vals, low_ts, high_vals, high_ts):
+    """
+    Return the (low index, high index) of the last candidate in scan order.
+
+    Both are -1 when no candidate lies inside the Fibonacci band.
+    """
+    j_ends, counts = _wave_2_ends(low_ts, high_ts)
+    best_i, best_j = -1, -1
+
+    # Later wave 2 ends win ties on i, so walk them from the last one down
+    for j, count in zip(j_ends[::-1].tolist(), counts[::-1].tolist()):
+        # Counts only shrink from here on, so no earlier end can beat best_i
+        if count - 1 <= best_i:
+            break
+        i = np.arange(best_i + 1, count, dtype=np.int64)
+        _, valid = _in_fibonacci_band(low_vals, high_vals, i, j)
+        hits = np.flatnonzero(valid)
+        if len(hits):
+            best_i, best_j = int(i[hits[-1]]), j
+
+    return best_i, best_j
+
+
+if njit is not None:
+    @njit(cache=True, error_model='numpy')
+    def _scan_waves(low_vals, low_ts, high_vals, high_ts):
+        """Compiled loop form of `_scan_waves_numpy`."""
+        n = min(len(low_vals), len(high_vals))
+        found = []
+        for i in range(n - 1):
+            # Wave 1 must peak after it starts, so skip highs at or before low i
+            j_lo = np.searchsorted(high_ts, low_ts[i], side='right') + 1
+            for j in range(max(i + 1, j_lo), n):
+                # Ensure chronological order of dates
+                if high_ts[j - 1] < low_ts[j]:
+                    wave_1_length = high_vals[j - 1] - low_vals[i]
+                    wave_2_retracement = abs((low_vals[j] - high_vals[j - 1]) / wave_1_length)
+                    if 0.5 <= wave_2_retracement <= 0.618:
+                        found.append((i, j, wave_2_retracement))
+
+        i_idx = np.empty(len(found), dtype=np.int64)
+        j_idx = np.empty(len(found), dtype=np.int64)
+        retrace = np.empty(len(found), dtype=np.float64)
+        for k in range(len(found)):
+            i_idx[k], j_idx[k], retrace[k] = found[k]
+        return i_idx, j_idx, retrace
+
+    @njit(cache=True, error_model='numpy')
+    def _find_last_wave(low_vals, low_ts, high_vals, high_ts):
+        """Compiled form of `_find_last_wave_numpy` that stops at the first hit."""
+        n = min(len(low_vals), len(high_vals))
+        # Walking the scan backwards, the first accepted candidate is the last one
+        for i in range(n - 2, -1, -1):
+            j_lo = np.searchsorted(high_ts, low_ts[i], side='right') + 1
+            for j in range(n - 1, max(i + 1, j_lo) - 1, -1):
+                if high_ts[j - 1] < low_ts[j]:
+                    wave_1_length = high_vals[j - 1] - low_vals[i]
+                    wave_2_retracement = abs((low_vals[j] - high_vals[j - 1]) / wave_1_length)
+                    if 0.5 <= wave_2_retracement <= 0.618:
+                        return i, j
+        return -1, -1
+else:
+    _scan_waves = _scan_waves_numpy
+    _find_last_wave = _find_last_wave_numpy
+
+
+# Standard Fibonacci retracement levels
+FIB_LEVELS = np.array([0.236, 0.382, 0.5, 0.618, 0.786])
+
+# Wave candidates: bar positions of the four swing points, their closes
+# and the wave 2 retracement
+WAVE_CANDIDATE_DTYPE = np.dtype([
+    ('w1_start', 'i8'), ('w2_start', 'i8'), ('w3_start', 'i8'), ('w3_end', 'i8'),
+    ('w1_lo', 'f8'), ('w1_hi', 'f8'), ('w2_lo', 'f8'), ('w3_hi', 'f8'),
+    ('retrace', 'f8'),
+])
+
+# Fetched histories are cached for the current day, in process and on disk;
+# each holds one entry per (ticker, period, interval), replaced once stale
+CACHE_DIR = Path('.yf_cache')
+_history_cache = {}
+
+
+def _load_history(ticker: str, period: str, interval: str) -> pd.DataFrame:
+    """
+    Return the raw price history for a ticker, fetching it at most once a day.
+
+    Lookups go through an in-process dict, then a memory-mapped parquet
+    file under `CACHE_DIR` (when pyarrow is installed), and only then hit
+    yfinance. Entries from an earlier day are refetched and overwritten.
+    Empty results are not cached, and a failed cache write only loses the
+    cache entry.
+    """
+    key = (ticker, period, interval)
+    today = date.today()
+    cached = _history_cache.get(key)
+    if cached is not None and cached[0] == today:
+        return cached[1]
+
+    path = CACHE_DIR / f"{'_'.join(key)}.parquet"
+    df = None
+    if pq is not None:
+        try:
+            if date.fromtimestamp(path.stat().st_mtime) == today:
+                df = pq.read_table(path, memory_map=True).to_pandas()
+        except (OSError, ValueError, pa.ArrowException):  # missing or unreadable cache file
+            pass
+
+    if df is None:
+        df = yf.Ticker(ticker).history(period=period, interval=interval)
+        if df.empty:
+            return df
+        if pq is not None:
+            tmp_path = None
+            try:
+                CACHE_DIR.mkdir(exist_ok=True)
+                # Write aside and rename, so readers never see a partial file
+                fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.parquet.tmp')
+                os.close(fd)
+                df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+                os.replace(tmp_path, path)
+            except (OSError, ValueError, pa.ArrowException):
+                pass
+            finally:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    _history_cache[key] = (today, df)
+    return df
+
+
+class Wave(NamedTuple):
+    """A single wave leg between two swing points."""
+    start_price: float
+    end_price: float
+    start_date: pd.Timestamp
+    end_date: pd.Timestamp
+    duration: pd.Timedelta
+
+
+class WavePattern(NamedTuple):
+    """Waves 1-3 of an Elliott Wave pattern."""
+    wave_1: Wave
+    wave_2: Wave
+    wave_3: Wave
+
 
 class ElliottWaveAnalyzer:
+    __slots__ = ('ticker', 'period', 'interval', 'data', '_close', '_index', '_ts')
+
     def __init__(self, ticker: str, period: str = '1y', interval: str = '1d'):
         """
         Initialize Elliott Wave Analyzer
@@ -14,30 +234,98 @@ class ElliottWaveAnalyzer:
         self.ticker = ticker
         self.period = period
         self.interval = interval
-        self.data = self._fetch_stock_data()
+        self._set_data(self._fetch_stock_data())
+
+    @classmethod
+    def from_df(cls, ticker: str, df: pd.DataFrame, period: str = '1y', interval: str = '1d'):
+        """
+        Build an analyzer from already fetched price history, skipping the download.
+
+        :param ticker: Stock ticker symbol
+        :param df: Price history indexed by a DatetimeIndex, with at least a 'Close' column
+        :param period: Historical data period the history covers
+        :param interval: Data interval of the history
+        """
+        analyzer = cls.__new__(cls)
+        analyzer.ticker = ticker
+        analyzer.period = period
+        analyzer.interval = interval
+
+        # Empty histories fail with "No data fetched" before the index is checked
+        df = analyzer._preprocess(df)
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError(f"Price history for {ticker} must have a DatetimeIndex, got {type(df.index).__name__}.")
+
+        analyzer._set_data(df)
+        return analyzer
+
+    @classmethod
+    def batch(cls, symbols, period: str = '1y', interval: str = '1d', max_workers: int = 8) -> dict:
+        """
+        Fetch several tickers concurrently and build an analyzer for each.
+
+        Downloads are I/O-bound, so they run on a thread pool and go through
+        the daily history cache. Used by the command line's --threaded mode.
+        Duplicate symbols are fetched once; symbols whose download fails or
+        whose history is unusable are reported and left out of the result.
+
+        :param symbols: Stock ticker symbols
+        :param period: Historical data period
+        :param interval: Data interval
+        :param max_workers: Maximum number of concurrent downloads
+        :return: Analyzers keyed by symbol, in the order given
+        """
+        symbols = list(dict.fromkeys(symbols))
+        analyzers = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_load_history, symbol, period, interval): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    print(f"Error fetching {symbol}: {e}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Fetching %s failed", symbol)
+                    continue
+
+                try:
+                    analyzers[symbol] = cls.from_df(symbol, df, period=period, interval=interval)
+                except Exception as e:
+                    print(f"Error preparing {symbol}: {e}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Preparing %s failed", symbol)
+
+        return {symbol: analyzers[symbol] for symbol in symbols if symbol in analyzers}
+
+    def _set_data(self, df: pd.DataFrame):
+        """Store the price history along with the arrays the scan runs on."""
+        self.data = df
+
+        # Plain arrays for the scan; the index is only needed to report dates
+        self._close = self.data['Close'].to_numpy(dtype=np.float64)
+        self._index = self.data.index
+        self._ts = self._index.asi8
     
     def _fetch_stock_data(self) -> pd.DataFrame:
         """Fetch and preprocess historical stock data."""
-        stock = yf.Ticker(self.ticker)
-        df = stock.history(period=self.period, interval=self.interval)
-        
+        df = self._preprocess(_load_history(self.ticker, self.period, self.interval))
+        print(f"Data fetched successfully for {self.ticker}. Number of rows: {len(df)}")
+        return df
+
+    def _preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Validate raw price history and drop bars without a close."""
+        df = df[df['Close'].notna()] if 'Close' in df else df.iloc[:0]
         if df.empty:
             raise ValueError(f"No data fetched for {self.ticker} with period='{self.period}' and interval='{self.interval}'.")
-        
-        print(f"Data fetched successfully for {self.ticker}. Number of rows: {len(df)}")
-        df['Returns'] = df['Close'].pct_change()
-        return df.dropna()
-    
-    def _detect_swings(self, prices: pd.Series, window: int = 5) -> (pd.Series, pd.Series):
-        """Detect swing highs and lows."""
-        swing_highs = (prices > prices.shift(1)) & (prices > prices.shift(-1))
-        swing_lows = (prices < prices.shift(1)) & (prices < prices.shift(-1))
-        
-        return prices[swing_highs], prices[swing_lows]
+        return df
     
-    def _fibonacci_retracement(self, high: float, low: float, level: float) -> float:
-        """Calculate Fibonacci retracement level."""
-        return high - (high - low) * level
+    def _fibonacci_retracement_all(self, high: float, low: float) -> np.ndarray:
+        """Calculate the retracement price at every level in FIB_LEVELS."""
+        return high - (high - low) * FIB_LEVELS
     
     def classify_pattern(self, wave_points):
         """
@@ -52,129 +340,212 @@ class ElliottWaveAnalyzer:
         if not wave_points:
             return "Insufficient Data"
         
-        # Extract wave details using the new dictionary structure
-        wave_1 = wave_points['Wave_1']['price_range']
-        wave_2 = wave_points['Wave_2']['price_range']
-        wave_3 = wave_points['Wave_3']['price_range']
-        
-        # Calculate wave lengths
-        wave_1_length = abs(wave_1[1] - wave_1[0])
-        wave_2_length = abs(wave_2[1] - wave_2[0])
-        wave_3_length = abs(wave_3[1] - wave_3[0])
-        
+        wave_lengths = [abs(wave.end_price - wave.start_price) for wave in wave_points]
+        return "Impulsive" if self.classify_pattern_batch(*wave_lengths).item() else "Corrective"
+
+    def classify_pattern_batch(self, wave_1_length, wave_2_length, wave_3_length) -> np.ndarray:
+        """
+        Apply the impulsive wave checks of `classify_pattern` to arrays of wave lengths.
+
+        :param wave_1_length: Absolute price lengths of wave 1 per candidate
+        :param wave_2_length: Absolute price lengths of wave 2 per candidate
+        :param wave_3_length: Absolute price lengths of wave 3 per candidate
+        :return: Boolean array, True where the candidate is impulsive
+        """
+        wave_1_length = np.asarray(wave_1_length, dtype=np.float64)
+        wave_3_length = np.asarray(wave_3_length, dtype=np.float64)
+
         # Retracement check
-        wave_2_retracement = wave_2_length / wave_1_length
-        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            wave_2_retracement = np.asarray(wave_2_length, dtype=np.float64) / wave_1_length
+
         # Preliminary impulsive wave checks
-        is_impulsive = (
-            0.382 <= wave_2_retracement <= 0.618 and  # Fibonacci retracement
-            wave_3_length > wave_1_length  # Wave 3 typically longest
+        return (
+            (0.382 <= wave_2_retracement) & (wave_2_retracement <= 0.618) &  # Fibonacci retracement
+            (wave_3_length > wave_1_length)  # Wave 3 typically longest
         )
-        
-        return "Impulsive" if is_impulsive else "Corrective"
 
-    def _detect_swings(self, prices: pd.Series, window: int = 5) -> (pd.Series, pd.Series):
-        """Detect swing highs and lows."""
-        swing_highs = (prices > prices.shift(1)) & (prices > prices.shift(-1))
-        swing_lows = (prices < prices.shift(1)) & (prices < prices.shift(-1))
-        
-        # Ensure chronological order and remove conflicting points
-        swing_highs = prices[swing_highs]
-        swing_lows = prices[swing_lows]
-        
-        # Sort both swing highs and lows by index to maintain chronological sequence
-        swing_highs = swing_highs.sort_index()
-        swing_lows = swing_lows.sort_index()
-        
-        return swing_highs, swing_lows
+    def _detect_swings(self, prices: np.ndarray, window: int = 1) -> (np.ndarray, np.ndarray):
+        """
+        Detect swing highs and lows, returned as positions into `prices`.
+
+        A swing high (low) is a price strictly above (below) every other
+        price within `window` bars on either side of it; `window` must be
+        at least 1.
+        """
+        if window < 1:
+            raise ValueError(f"Swing window must be at least 1, got {window}.")
+        if len(prices) < 2 * window + 1:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        # One row per bar that has a full window on both sides
+        windows = sliding_window_view(prices, 2 * window + 1)
+        centers = windows[:, window:window + 1]
+        neighbours = np.delete(windows, window, axis=1)
+
+        highs_mask = np.all(centers > neighbours, axis=1)
+        lows_mask = np.all(centers < neighbours, axis=1)
+
+        # Offset window rows back to bar positions
+        return np.flatnonzero(highs_mask) + window, np.flatnonzero(lows_mask) + window
+
+    def _scan_inputs(self):
+        """Swing positions plus the (low_vals, low_ts, high_vals, high_ts) arrays the scan runs on."""
+        high_pos, low_pos = self._detect_swings(self._close)
+
+        # Timestamps as int64 for cheap comparisons
+        scan_args = (self._close[low_pos], self._ts[low_pos], self._close[high_pos], self._ts[high_pos])
+        return high_pos, low_pos, scan_args
+
+    def _wave_pattern(self, *positions) -> WavePattern:
+        """Build the waves between four swing points given as bar positions."""
+        positions = np.array(positions, dtype=np.int64)
+        prices = self._close[positions]
+        dates = self._index[positions]
+
+        # Wave durations as int64 gaps between the swing timestamps
+        durations = np.diff(self._ts[positions]).tolist()
+        unit = self._index.unit
+
+        return WavePattern(*(
+            Wave(prices[k], prices[k + 1], dates[k], dates[k + 1], pd.Timedelta(durations[k], unit=unit))
+            for k in range(3)
+        ))
+
+    def wave_candidates(self) -> np.ndarray:
+        """
+        Return every wave 1-3 candidate inside the Fibonacci band, in scan order.
+
+        Rows follow `WAVE_CANDIDATE_DTYPE`; expand one with `wave_pattern`.
+        """
+        high_pos, low_pos, scan_args = self._scan_inputs()
+        i, j, retrace = _scan_waves(*scan_args)
+
+        candidates = np.empty(len(i), dtype=WAVE_CANDIDATE_DTYPE)
+        candidates['w1_start'] = low_pos[i]
+        candidates['w2_start'] = high_pos[j - 1]
+        candidates['w3_start'] = low_pos[j]
+        candidates['w3_end'] = high_pos[j]
+        candidates['w1_lo'] = self._close[candidates['w1_start']]
+        candidates['w1_hi'] = self._close[candidates['w2_start']]
+        candidates['w2_lo'] = self._close[candidates['w3_start']]
+        candidates['w3_hi'] = self._close[candidates['w3_end']]
+        candidates['retrace'] = retrace
+        return candidates
+
+    def wave_pattern(self, candidate) -> WavePattern:
+        """
+        Expand one row of `wave_candidates` into its waves.
+
+        :param candidate: Record with `WAVE_CANDIDATE_DTYPE` fields
+        """
+        return self._wave_pattern(
+            candidate['w1_start'], candidate['w2_start'], candidate['w3_start'], candidate['w3_end']
+        )
 
     def identify_wave(self):
         """
         Identify the Elliott Wave pattern with timeframe information.
         """
+        high_pos, low_pos, scan_args = self._scan_inputs()
+
+        # Only the last accepted candidate is reported, so stop the scan there
+        i, j = _find_last_wave(*scan_args)
+
+        if i < 0:
+            print("No valid Elliott Wave patterns found.")
+            return None
+
+        latest_wave = self._wave_pattern(low_pos[i], high_pos[j - 1], low_pos[j], high_pos[j])
+        pattern_type = self.classify_pattern(latest_wave)
+
+        # Enhanced report with timeframe details, written out in one go
+        report = ["Latest Elliott Wave Identified:"]
+        for wave_name, wave_data in zip(latest_wave._fields, latest_wave):
+            report.append(
+                f"\n{wave_name.capitalize()}:\n"
+                f"  Price Range: ${wave_data.start_price:.2f} - ${wave_data.end_price:.2f}\n"
+                f"  Start Date: {wave_data.start_date.date()}\n"
+                f"  End Date: {wave_data.end_date.date()}\n"
+                f"  Duration: {wave_data.duration}"
+            )
+        report.append(f"\nPattern Classification: {pattern_type}")
+        print("\n".join(report))
+
+        return latest_wave
+
+
+def run_batch(symbols, period: str = '1y', interval: str = '1d', threaded: bool = False):
+    """
+    Identify waves for each symbol of a watchlist.
+
+    The watchlist is downloaded in one yfinance call, or with `threaded`
+    fetched per symbol on a thread pool through the daily history cache.
+    """
+    if threaded:
+        analyzers = ElliottWaveAnalyzer.batch(symbols, period=period, interval=interval)
+        symbols = list(analyzers)
+    else:
+        data = yf.download(tickers=symbols, period=period, interval=interval, group_by='ticker', threads=True)
+
+    for symbol in symbols:
         try:
-            prices = self.data['Close']
-            swing_highs, swing_lows = self._detect_swings(prices)
-
-            wave_points = []
-            for i in range(len(swing_lows) - 1):
-                for j in range(i + 1, len(swing_highs)):
-                    wave_1_low = swing_lows.iloc[i]
-                    wave_1_high = swing_highs.iloc[j-1]
-                    wave_2_low = swing_lows.iloc[j]
-                    
-                    # Ensure chronological order of dates
-                    if swing_lows.index[i] < swing_highs.index[j-1] < swing_lows.index[j]:
-                        # Additional wave identification logic
-                        wave_1_length = wave_1_high - wave_1_low
-                        wave_2_retracement = abs((wave_2_low - wave_1_high) / wave_1_length)
-
-                        # Check for next potential wave high
-                        if j < len(swing_highs):
-                            wave_3_high = swing_highs.iloc[j]
-                            
-                            if 0.5 <= wave_2_retracement <= 0.618:
-                                wave_points.append({
-                                    'Wave_1': {
-                                        'price_range': (wave_1_low, wave_1_high),
-                                        'start_date': swing_lows.index[i],
-                                        'end_date': swing_highs.index[j-1],
-                                        'duration': swing_highs.index[j-1] - swing_lows.index[i]
-                                    },
-                                    'Wave_2': {
-                                        'price_range': (wave_1_high, wave_2_low),
-                                        'start_date': swing_highs.index[j-1],
-                                        'end_date': swing_lows.index[j],
-                                        'duration': swing_lows.index[j] - swing_highs.index[j-1]
-                                    },
-                                    'Wave_3': {
-                                        'price_range': (wave_2_low, wave_3_high),
-                                        'start_date': swing_lows.index[j],
-                                        'end_date': swing_highs.index[j],
-                                        'duration': swing_highs.index[j] - swing_lows.index[j]
-                                    }
-                                })
-
-            # Return and process waves as before
-            if not wave_points:
-                print("No valid Elliott Wave patterns found.")
-                return None
-
-            latest_wave = wave_points[-1]
-            print("Latest Elliott Wave Identified:")
-            
-            # Enhanced print with timeframe details
-            for wave_name, wave_data in latest_wave.items():
-                print(f"\n{wave_name}:")
-                print(f"  Price Range: ${wave_data['price_range'][0]:.2f} - ${wave_data['price_range'][1]:.2f}")
-                print(f"  Start Date: {wave_data['start_date'].date()}")
-                print(f"  End Date: {wave_data['end_date'].date()}")
-                print(f"  Duration: {wave_data['duration']}")
-
-            pattern_type = self.classify_pattern(latest_wave)
-            print("\nPattern Classification:", pattern_type)
-            
-            return latest_wave
+            print(f"\n=== {symbol} ===")
+            if threaded:
+                analyzer = analyzers[symbol]
+            else:
+                df = data[symbol] if isinstance(data.columns, pd.MultiIndex) else data
+                analyzer = ElliottWaveAnalyzer.from_df(symbol, df, period=period, interval=interval)
+            wave = analyzer.identify_wave()
 
+            if wave:
+                print("\nIdentified Elliott Wave Details:")
+                print(wave)
         except Exception as e:
-            print(f"Detailed Error in Wave Identification:")
-            print(f"Error Type: {type(e).__name__}")
-            print(f"Error Message: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return None
-    
+            print(f"Error: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception("Wave identification failed for %s", symbol)
+
+
 # Main Routine
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Identify Elliott Wave patterns in stock prices.")
+    parser.add_argument('symbols', nargs='*', help="Stock symbols to analyze in batch; prompts interactively if omitted")
+    parser.add_argument('--period', default='1y', help="Historical data period for batch mode (default: 1y)")
+    parser.add_argument('--interval', default='1d', help="Historical data interval for batch mode (default: 1d)")
+    parser.add_argument('--threaded', action='store_true', help="Fetch batch symbols on a thread pool through the daily cache instead of one download")
+    parser.add_argument('--debug', action='store_true', help="Log full tracebacks for errors")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+
+    if args.symbols:
+        run_batch(
+            [symbol.upper() for symbol in args.symbols],
+            period=args.period.lower(),
+            interval=args.interval.lower(),
+            threaded=args.threaded,
+        )
+        sys.exit()
+
     while True:
         try:
-            symbol = input("\nEnter stock symbol (or 'q' to quit): ").upper()
+            # One line per query, e.g. 'AAPL', 'AAPL:3mo' or 'AAPL:1y:1wk'
+            raw = input("\nEnter symbol[:period[:interval]] (or 'q' to quit): ")
+        except EOFError:
+            raw = 'q'
+
+        try:
+            symbol, period, interval = (raw.split(':') + ['', ''])[:3]
+            symbol = symbol.strip().upper()
+            if not symbol:
+                continue
             if symbol == 'Q':
                 print("Exiting the program. Thank you!")
                 break
 
-            period = input("Enter historical data period (e.g., '1mo', '3mo', '1y'): ").lower()
-            interval = input("Enter historical data interval (e.g., '1d', '1wk', '1mo'): ").lower()
+            period = period.strip().lower() or '1y'
+            interval = interval.strip().lower() or '1d'
 
             analyzer = ElliottWaveAnalyzer(symbol, period=period, interval=interval)
             wave = analyzer.identify_wave()
@@ -184,3 +555,5 @@ if __name__ == "__main__":
                 print(wave)
         except Exception as e:
             print(f"Error: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception("Wave identification failed for %s", symbol)